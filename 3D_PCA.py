@@ -1,4 +1,5 @@
 import pandas as pd
+from efd_harmonics import N_HARMONICS, load_efd_table, harmonic_prefix
 from sklearn.decomposition import PCA
 from sklearn.preprocessing import StandardScaler
 import plotly.express as px
@@ -12,13 +13,12 @@ except NameError:
 
 # --- 1. Load and Prepare the Data ---
 try:
-    df = pd.read_csv(r"C:\Users\User\Documents\Bioinformatics_Year3_Sem2\Internship\Fly Project\normalized_efd_coefficients_10h.csv")
+    df, coeffs = load_efd_table(r"C:\Users\User\Documents\Bioinformatics_Year3_Sem2\Internship\Fly Project\normalized_efd_coefficients_30h.csv", N_HARMONICS)
 except FileNotFoundError:
     print("Error: The CSV file was not found. Please check the path.")
     exit()
 
-harmonic_columns = [f"{char}{i}" for char in 'abcd' for i in range(1, 11)]
-X = df[harmonic_columns]
+X = harmonic_prefix(coeffs, N_HARMONICS)  # zero-copy view of the first N_HARMONICS harmonics
 
 # --- 2. Perform PCA ---
 pca = PCA(n_components=3)
@@ -1,4 +1,5 @@
 import pandas as pd
+from efd_harmonics import N_HARMONICS, load_efd_table, harmonic_prefix
 from sklearn.discriminant_analysis import LinearDiscriminantAnalysis
 from sklearn.preprocessing import StandardScaler
 import seaborn as sns
@@ -13,7 +14,7 @@ except NameError:
 
 # --- 1. Load and Prepare the Data ---
 try:
-    df = pd.read_csv(r"C:\Users\User\Documents\Bioinformatics_Year3_Sem2\Internship\Fly Project\normalized_efd_coefficients_10h.csv")
+    df, coeffs = load_efd_table(r"C:\Users\User\Documents\Bioinformatics_Year3_Sem2\Internship\Fly Project\normalized_efd_coefficients_30h.csv", N_HARMONICS)
 except FileNotFoundError:
     print("Error: The CSV file was not found. Please check the path.")
     exit()
@@ -22,8 +23,7 @@ if df['gender'].nunique() < 2:
     print("Error: The 'gender' column must contain at least two unique groups to perform LDA.")
     exit()
 
-harmonic_columns = [f"{char}{i}" for char in 'abcd' for i in range(1, 11)]
-X = df[harmonic_columns]
+X = harmonic_prefix(coeffs, N_HARMONICS)  # zero-copy view of the first N_HARMONICS harmonics
 y = df['gender']
 
 # --- 2. Perform LDA by Gender ---
@@ -2,14 +2,14 @@ import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
 import os
+from efd_harmonics import N_HARMONICS, load_efd_table
 
 # === Load the CSV ===
-file_path = r"C:\Users\User\Documents\Bioinformatics_Year3_Sem2\Internship\Fly Project\normalized_efd_coefficients_10h.csv"
-df = pd.read_csv(file_path)
+file_path = r"C:\Users\User\Documents\Bioinformatics_Year3_Sem2\Internship\Fly Project\normalized_efd_coefficients_30h.csv"
+df, _ = load_efd_table(file_path, N_HARMONICS)
 
 # === Function: reconstruct contour from EFD coefficients ===
-def reconstruct_contour(coeffs, num_points=300):
-    n_harmonics = 10
+def reconstruct_contour(coeffs, num_points=300, n_harmonics=N_HARMONICS):
     t = np.linspace(0, 2 * np.pi, num_points)
     xt = np.zeros(num_points)
     yt = np.zeros(num_points)
@@ -4,7 +4,7 @@ library(imager)
 
 # 2. Set Up Your Folders
 image_folder <- "C:/Users/User/Documents/Bioinformatics_Year3_Sem2/Internship/Fly Project/Image"
-output_file <- "C:/Users/User/Documents/Bioinformatics_Year3_Sem2/Internship/Fly Project/Image/test_efd_coefficients_10h.csv"
+output_file <- "C:/Users/User/Documents/Bioinformatics_Year3_Sem2/Internship/Fly Project/Image/test_efd_coefficients_30h.csv"
 
 # Helper function to extract largest contour by area
 get_largest_contour <- function(contours) {
@@ -17,7 +17,9 @@ get_largest_contour <- function(contours) {
     contours[[which.max(contour_areas)]]
 }
 
-harmonics <- 10
+# Extract once at a high order; downstream scripts take the first k harmonics
+# (keep in sync with MAX_HARMONICS in efd_harmonics.py)
+harmonics <- 30
 all_results <- list()
 
 # List all subfolders in image_folder
@@ -43,13 +45,18 @@ for (subfolder in subfolders) {
                     nb.h <- min(harmonics, nrow(contour_matrix) %/% 2)
                     tryCatch({
                         coe <- efourier(contour_matrix, nb.h = nb.h, norm = FALSE)
+                        # Harmonic-major layout (a1, b1, c1, d1, a2, ...) so the first k harmonics
+                        # are the first 4*k columns; unfitted harmonics are left as NA
                         actual_harmonics <- length(coe$an)
+                        coef_matrix <- matrix(NA_real_, nrow = 4, ncol = harmonics)
+                        coef_matrix[, seq_len(actual_harmonics)] <- rbind(coe$an, coe$bn, coe$cn, coe$dn)
                         coef_data <- data.frame(
                             image_id = filename,
                             species = species_name,
-                            t(c(coe$an, coe$bn, coe$cn, coe$dn))
+                            n_harmonics_fitted = actual_harmonics,
+                            t(as.vector(coef_matrix))
                         )
-                        colnames(coef_data)[3:(2 + 4 * actual_harmonics)] <- unlist(lapply(c("a", "b", "c", "d"), function(prefix) paste0(prefix, 1:actual_harmonics)))
+                        colnames(coef_data)[4:(3 + 4 * harmonics)] <- paste0(c("a", "b", "c", "d"), rep(1:harmonics, each = 4))
                         all_results[[paste0(species_name, "_", filename)]] <- coef_data
                     }, error = function(e) {
                         cat("   Error in efourier for:", filename, "-", e$message, "\n")
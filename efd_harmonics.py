@@ -0,0 +1,177 @@
+import pandas as pd
+import numpy as np
+
+# Highest harmonic order extracted by efd_final.r. Coefficients are stored
+# harmonic-major (a1, b1, c1, d1, a2, b2, ...) so the first k harmonics are
+# always the first 4*k coefficient columns. Harmonics that could not be fitted
+# for a sample are left empty (NA) and its fitted order is recorded in the
+# n_harmonics_fitted column.
+MAX_HARMONICS = 30
+
+# Number of harmonics used by the downstream analyses (PCA, LDA, MANOVA, plots).
+N_HARMONICS = 10
+
+
+def harmonic_columns(n_harmonics):
+    """Return the coefficient column names for the first n harmonics, harmonic-major."""
+    return [f'{coeff}{i}' for i in range(1, n_harmonics + 1) for coeff in 'abcd']
+
+
+def count_harmonics(df):
+    """Return the number of consecutive harmonics (from 1) with all four a/b/c/d columns present."""
+    n = 0
+    while all(f'{coeff}{n + 1}' in df.columns for coeff in 'abcd'):
+        n += 1
+    return n
+
+
+def load_efd_table(filepath, n_harmonics=None):
+    """
+    Loads an EFD coefficient CSV into a harmonic-major coefficient array.
+
+    The coefficients are copied once into a C-contiguous array of shape
+    (n_samples, n_harmonics, 4), where the last axis holds (a, b, c, d).
+    Any number of leading harmonics can then be taken with harmonic_prefix()
+    without copying. Harmonics beyond a sample's fitted order are NaN.
+
+    Args:
+        filepath (str): The path to the EFD coefficient CSV file.
+        n_harmonics (int, optional): If given, samples fitted to fewer than
+            this many harmonics are excluded, so the first n_harmonics
+            harmonics contain no padding.
+
+    Returns:
+        tuple: (df, coeffs) where df is the DataFrame read from the file (with
+        an n_harmonics_fitted column) and coeffs is the
+        (n_samples, n_harmonics, 4) float array, both restricted to the kept samples.
+    """
+    df = pd.read_csv(filepath)
+    max_harmonics = count_harmonics(df)
+    if max_harmonics == 0:
+        raise ValueError(f"No EFD coefficient columns (a1, b1, c1, d1, ...) found in '{filepath}'.")
+    if max_harmonics != MAX_HARMONICS:
+        print(f"Warning: '{filepath}' holds {max_harmonics} harmonics, expected {MAX_HARMONICS}. "
+              f"Re-run efd_final.r if the file is out of date.")
+
+    coeffs = df[harmonic_columns(max_harmonics)].to_numpy(dtype=float).reshape(len(df), max_harmonics, 4)
+    if 'n_harmonics_fitted' not in df.columns:
+        # Count the leading harmonics with all four coefficients present.
+        fitted = np.isfinite(coeffs).all(axis=2)
+        n_fitted = pd.Series(np.cumprod(fitted, axis=1).sum(axis=1), index=df.index, name='n_harmonics_fitted')
+        df = pd.concat([df, n_fitted], axis=1)
+
+    if n_harmonics is not None:
+        if n_harmonics > max_harmonics:
+            raise ValueError(f"Requested {n_harmonics} harmonics but only {max_harmonics} are available.")
+        keep = (df['n_harmonics_fitted'] >= n_harmonics).to_numpy()
+        if not keep.all():
+            print(f"Excluding {np.count_nonzero(~keep)} samples fitted to fewer than {n_harmonics} harmonics.")
+            df = df[keep].reset_index(drop=True)
+            coeffs = coeffs[keep]
+    return df, np.ascontiguousarray(coeffs)
+
+
+def harmonic_prefix(coeffs, n_harmonics):
+    """
+    Returns a zero-copy (n_samples, 4 * n_harmonics) view of the first n harmonics.
+
+    Columns are ordered as harmonic_columns(n_harmonics). Raises ValueError if
+    the prefix contains unfitted (NaN) harmonics; load the table with
+    load_efd_table(filepath, n_harmonics) to exclude those samples.
+    """
+    if n_harmonics > coeffs.shape[1]:
+        raise ValueError(f"Requested {n_harmonics} harmonics but only {coeffs.shape[1]} are available.")
+    prefix = coeffs[:, :n_harmonics].reshape(coeffs.shape[0], 4 * n_harmonics)
+    if np.isnan(prefix).any():
+        raise ValueError(f"Some samples were fitted to fewer than {n_harmonics} harmonics.")
+    return prefix
+
+
+def harmonic_power(coeffs):
+    """Return the Fourier power (a^2 + b^2 + c^2 + d^2) / 2 of every harmonic, shape (n_samples, n_harmonics)."""
+    return 0.5 * np.einsum('shk,shk->sh', coeffs, coeffs)
+
+
+def cumulative_harmonic_power(coeffs, drop_first=True):
+    """
+    Computes the cumulative fraction of total Fourier power captured by the
+    first k harmonics, for every sample and every k at once.
+
+    The first harmonic describes the overall ellipse and dominates the power,
+    so by default it is excluded from both the running sum and the total
+    (as in Momocs' calibrate_harmonicpower).
+
+    Args:
+        coeffs (np.ndarray): A (n_samples, n_harmonics, 4) coefficient array.
+        drop_first (bool): Whether to exclude the first harmonic.
+
+    Returns:
+        np.ndarray: A (n_samples, n_harmonics) array where column k-1 is the
+        fraction of power captured by harmonics 1..k, relative to the sample's
+        fitted order. Entries beyond the fitted order are NaN.
+    """
+    power = harmonic_power(coeffs)
+    unfitted = np.isnan(power)
+    power[unfitted] = 0
+    if drop_first:
+        power[:, 0] = 0
+    cumulative = np.cumsum(power, axis=1)
+    total = cumulative[:, -1:].copy()
+    total[total == 0] = 1
+    cumulative /= total
+    cumulative[unfitted] = np.nan
+    return cumulative
+
+
+def harmonic_power_report(coeffs, thresholds=(0.9, 0.95, 0.99, 0.999), drop_first=True):
+    """
+    Summarizes cumulative harmonic power across the whole dataset.
+
+    Only samples fitted to every harmonic are included, since a sample with a
+    lower fitted order would reach 100% of its power early.
+
+    Args:
+        coeffs (np.ndarray): A (n_samples, n_harmonics, 4) coefficient array.
+        thresholds (tuple): Power fractions for which the number of harmonics
+            needed is reported.
+        drop_first (bool): Whether to exclude the first harmonic.
+
+    Returns:
+        tuple: (report, needed) where report is a DataFrame indexed by harmonic
+        with the mean, median and minimum cumulative power across samples, and
+        needed maps each threshold to the smallest number of harmonics whose
+        median cumulative power reaches it (None if never reached).
+    """
+    cumulative = cumulative_harmonic_power(coeffs, drop_first=drop_first)
+    cumulative = cumulative[~np.isnan(cumulative).any(axis=1)]
+    if len(cumulative) == 0:
+        raise ValueError(f"No samples were fitted to all {coeffs.shape[1]} harmonics.")
+    report = pd.DataFrame({
+        'mean': cumulative.mean(axis=0),
+        'median': np.median(cumulative, axis=0),
+        'min': cumulative.min(axis=0),
+    }, index=pd.RangeIndex(1, cumulative.shape[1] + 1, name='harmonic'))
+
+    needed = {}
+    for threshold in thresholds:
+        reached = np.flatnonzero(report['median'].to_numpy() >= threshold)
+        needed[threshold] = int(reached[0]) + 1 if reached.size else None
+    return report, needed
+
+
+if __name__ == '__main__':
+    input_csv = r"C:\Users\User\Documents\Bioinformatics_Year3_Sem2\Internship\Fly Project\normalized_efd_coefficients_30h.csv"
+    try:
+        df, coeffs = load_efd_table(input_csv, MAX_HARMONICS)
+    except FileNotFoundError:
+        print(f"Error: The file '{input_csv}' was not found.")
+        exit()
+
+    report, needed = harmonic_power_report(coeffs)
+    print(f"Cumulative harmonic power for {coeffs.shape[0]} samples ({coeffs.shape[1]} harmonics, first harmonic excluded):")
+    print(report.to_string(float_format=lambda v: f"{v:.4f}"))
+    for threshold, n_harmonics in needed.items():
+        if n_harmonics is None:
+            print(f"  {threshold:.1%} of power: not reached within {coeffs.shape[1]} harmonics")
+        else:
+            print(f"  {threshold:.1%} of power: {n_harmonics} harmonics")
@@ -2,12 +2,18 @@
 library(tidyverse)
 library(MASS)
 
-mahalanobis_hotelling_pca <- function(df, harmonics_pattern = "^[abcd][0-9]+$", 
+mahalanobis_hotelling_pca <- function(df, n_harmonics = 10,
                                       var_threshold = 0.9,
                                       male_label = "male", female_label = "female") {
   
-  # --- Identify harmonics and run PCA ---
-  harmonics <- grep(harmonics_pattern, names(df), value = TRUE)
+  # --- Take the first n_harmonics harmonics (harmonic-major columns) and run PCA ---
+  # Keep n_harmonics equal to N_HARMONICS in efd_harmonics.py
+  harmonics <- paste0(c("a", "b", "c", "d"), rep(1:n_harmonics, each = 4))
+  fitted <- complete.cases(df[, harmonics])
+  if (!all(fitted)) {
+    cat("Excluding", sum(!fitted), "samples fitted to fewer than", n_harmonics, "harmonics\n")
+    df <- df[fitted, ]
+  }
   harmonics_mat <- scale(df[, harmonics])
   
   pca <- prcomp(harmonics_mat, center = TRUE, scale. = TRUE)
@@ -98,8 +104,8 @@ mahalanobis_hotelling_pca <- function(df, harmonics_pattern = "^[abcd][0-9]+$",
 }
 
 # --- Example usage ---
-file_path <- "C:/Users/User/Documents/Bioinformatics_Year3_Sem2/Internship/Fly Project/normalized_efd_coefficients_10h.csv"
+file_path <- "C:/Users/User/Documents/Bioinformatics_Year3_Sem2/Internship/Fly Project/normalized_efd_coefficients_30h.csv"
 df <- read.csv(file_path)
 
-results <- mahalanobis_hotelling_pca(df, var_threshold = 0.9)
+results <- mahalanobis_hotelling_pca(df, n_harmonics = 10, var_threshold = 0.9)
 print(results)
@@ -4,12 +4,14 @@ import matplotlib.pyplot as plt
 from sklearn.decomposition import PCA
 from sklearn.preprocessing import StandardScaler
 from statsmodels.formula.api import ols
+from efd_harmonics import N_HARMONICS, harmonic_columns, load_efd_table
 
 # --- Load dataset ---
 # NOTE: You will need to replace this path with the actual location of your file.
 try:
-    df = pd.read_csv(
-        r"C:\Users\User\Documents\Bioinformatics_Year3_Sem2\Internship\Fly Project\normalized_efd_coefficients_10h.csv"
+    df, _ = load_efd_table(
+        r"C:\Users\User\Documents\Bioinformatics_Year3_Sem2\Internship\Fly Project\normalized_efd_coefficients_30h.csv",
+        N_HARMONICS,
     )
 except FileNotFoundError:
     print("File not found. Please update the file path in the script.")
@@ -17,12 +19,12 @@ except FileNotFoundError:
     data = {'species': ['A', 'A', 'B', 'B'] * 10,
             'gender': ['M', 'F', 'M', 'F'] * 10,
             'image_id': [f'id_{i}' for i in range(40)]}
-    for i in range(40):
-        data[f'H{i}'] = np.random.rand(40)
+    for col in harmonic_columns(N_HARMONICS):
+        data[col] = np.random.rand(40)
     df = pd.DataFrame(data)
 
 # --- Extract harmonics (features) ---
-harmonics_cols = [c for c in df.columns if c not in ["image_id", "species", "gender"]]
+harmonics_cols = harmonic_columns(N_HARMONICS)
 Y_raw = df[harmonics_cols].values
 
 # --- Encode factors ---
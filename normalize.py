@@ -1,5 +1,6 @@
 import pandas as pd
 import numpy as np
+from efd_harmonics import count_harmonics, harmonic_columns
 
 def normalize_efd_dataset(input_filepath, output_filepath):
     """
@@ -17,7 +18,8 @@ def normalize_efd_dataset(input_filepath, output_filepath):
     3. Eigen decomposition is performed on M.
     4. The largest eigenvalue of M (lambda_max) is found.
     5. The semi-major axis is calculated as p = sqrt(lambda_max).
-    6. All 40 harmonic coefficients for the sample are divided by p.
+    6. All harmonic coefficients for the sample (4 per harmonic, however many
+       harmonics the file holds) are divided by p.
 
     Args:
         input_filepath (str): The path to the input CSV file with EFD coefficients.
@@ -30,6 +32,14 @@ def normalize_efd_dataset(input_filepath, output_filepath):
         print(f"Error: The file '{input_filepath}' was not found.")
         return
 
+    # Get a list of all coefficient column names
+    n_harmonics = count_harmonics(df)
+    if n_harmonics == 0:
+        print("Error: No EFD coefficient columns (a1, b1, c1, d1, ...) were found.")
+        return
+    coeff_columns = harmonic_columns(n_harmonics)
+    print(f"Found {n_harmonics} harmonics.")
+
     # Keep a copy of the original data for metadata
     df_normalized = df.copy()
 
@@ -66,15 +76,6 @@ def normalize_efd_dataset(input_filepath, output_filepath):
 
     # --- Normalization ---
 
-    # Get a list of all coefficient column names
-    coeff_columns = [f'{coeff}{i}' for coeff in 'abcd' for i in range(1, 11)]
-    
-    # Ensure all expected columns exist
-    missing_cols = [col for col in coeff_columns if col not in df.columns]
-    if missing_cols:
-        print(f"Error: The following required columns are missing: {missing_cols}")
-        return
-
     # 7. Divide all coefficient columns by the corresponding p-value for each row.
     df_normalized[coeff_columns] = df[coeff_columns].div(p, axis=0)
 
@@ -87,7 +88,7 @@ def normalize_efd_dataset(input_filepath, output_filepath):
 
 
 if __name__ == '__main__':
-    input_csv = r"C:\Users\User\Documents\Bioinformatics_Year3_Sem2\Internship\Fly Project\flip_efd_coefficients_10h.csv"
-    output_csv = r"C:\Users\User\Documents\Bioinformatics_Year3_Sem2\Internship\Fly Project\normalized_efd_coefficients_10h.csv"
+    input_csv = r"C:\Users\User\Documents\Bioinformatics_Year3_Sem2\Internship\Fly Project\flip_efd_coefficients_30h.csv"
+    output_csv = r"C:\Users\User\Documents\Bioinformatics_Year3_Sem2\Internship\Fly Project\normalized_efd_coefficients_30h.csv"
     normalize_efd_dataset(input_csv, output_csv)
 